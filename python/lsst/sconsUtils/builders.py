@@ -6,6 +6,7 @@ __all__ = ("filesToTag", "DoxygenBuilder")
 
 import csv
 import fnmatch
+import io
 import os
 import re
 import shlex
@@ -211,10 +212,11 @@ def CleanTree(self, filePatterns, dirPatterns="", directory=".", verbose=False):
 
     Parameters
     ----------
-    filePatterns : `str`
-        Glob to match for files to be deleted.
-    dirPatterns : `str`, optional
-        Specification of directories to be removed.
+    filePatterns : `str` or `list` [`str`]
+        Globs to match for files to be deleted, either as a list or as a
+        single whitespace-delimited string.
+    dirPatterns : `str` or `list` [`str`], optional
+        Specification of directories to be removed, in the same form.
     directory : `str`, optional
         Directory to clean.
     verbose : `bool`, optional
@@ -263,7 +265,7 @@ def CleanTree(self, filePatterns, dirPatterns="", directory=".", verbose=False):
     # "scons --clean", so the former is no longer supported.
     action += " ; rm -rf .sconf_temp .sconsign.dblite .sconsign.tmp config.log"
 
-    if dirPatterns != "":
+    if dirPatterns:
         action += " ; "
         action += genFindCommand(dirPatterns, directory, verbose, filesOnly=False)
     # Do we actually want to clean up?  We don't if the command is e.g.
@@ -339,6 +341,7 @@ class DoxygenBuilder:
             action=self.buildConfig,
         )
         env.AlwaysBuild(config)
+        env.Precious(config)
         doc = env.Command(
             target=self.targets, source=self.sources, action=f"doxygen {shlex.quote(outConfigNode.abspath)}"
         )
@@ -389,7 +392,7 @@ class DoxygenBuilder:
             self.targets.append(SCons.Script.Dir(item))
 
     def buildConfig(self, target, source, env):
-        outConfigFile = open(target[0].abspath, "w")
+        outConfigFile = io.StringIO()
 
         # Need a routine to quote paths that contain spaces
         # but can not use shlex.quote because it has to be
@@ -439,7 +442,8 @@ class DoxygenBuilder:
                 state.log.finish()
             outConfigFile.write(f"GENERATE_{output.upper()} = YES\n")
             outConfigFile.write(f"{output.upper()}_OUTPUT = {_quote_path(path.abspath)}\n")
-        for output in allOutputs:
+        # Sorted so that the file content is reproducible.
+        for output in sorted(allOutputs):
             outConfigFile.write(f"GENERATE_{output.upper()} = NO\n")
         if self.makeTag is not None:
             outConfigFile.write(f"GENERATE_TAGFILE = {_quote_path(self.makeTag)}\n")
@@ -450,7 +454,7 @@ class DoxygenBuilder:
             with open(source[0].abspath) as inConfigFile:
                 outConfigFile.write(inConfigFile.read())
 
-        outConfigFile.close()
+        _writeIfChanged(target[0].abspath, outConfigFile.getvalue())
 
 
 @memberOf(SConsEnvironment)
@@ -558,6 +562,23 @@ def _get_version_string(versionString):
     return versionString
 
 
+def _writeIfChanged(filename, content):
+    """Write text to a file unless it already has exactly that content.
+
+    Leaving an identical file alone preserves its timestamp.  Targets
+    written this way should be marked ``Precious`` so that SCons does not
+    delete them before their action runs.
+    """
+    try:
+        with open(filename) as inFile:
+            if inFile.read() == content:
+                return
+    except OSError:
+        pass
+    with open(filename, "w") as outFile:
+        outFile.write(content)
+
+
 def _calcMd5(filename):
     try:
         import hashlib
@@ -582,7 +603,7 @@ def VersionModule(self, filename, versionString=None):
         parts = version.split("+")
 
         names = []
-        with open(target[0].abspath, "w") as outFile:
+        with io.StringIO() as outFile:
             outFile.write("# -------- This file is automatically generated by LSST's sconsUtils -------- #\n")
 
             version_info = None
@@ -636,6 +657,9 @@ def VersionModule(self, filename, versionString=None):
             for n in names:
                 outFile.write(f'    "{n}",\n')
             outFile.write(")\n")
+            content = outFile.getvalue()
+
+        _writeIfChanged(target[0].abspath, content)
 
         if _calcMd5(target[0].abspath) != oldMd5:  # only print if something's changed
             state.log.info(f'makeVersionModule(["{target[0]}"], [])')
@@ -643,6 +667,7 @@ def VersionModule(self, filename, versionString=None):
     result = self.Command(filename, [], self.Action(makeVersionModule, strfunction=lambda *args: None))
 
     self.AlwaysBuild(result)
+    self.Precious(result)
     return result
 
 
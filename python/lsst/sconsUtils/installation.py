@@ -291,7 +291,7 @@ class DirectoryInstaller:
 
     Parameters
     ----------
-    ignoreRegex : `str`
+    ignoreRegex : `str` or `re.Pattern`
         Regular expression to use to ignore files and directories.
     recursive : `bool`
         Control whether to recurse through directories.
@@ -337,7 +337,7 @@ def InstallDir(self, prefix, dir, ignoreRegex=r"(~$|\.pyc$|\.os?$)", recursive=T
         Prefix to use for installation.
     dir : `str`
         Directory to install.
-    ignoreRegex : `str`
+    ignoreRegex : `str` or `re.Pattern`
         Regular expression to control whether a file is ignored.
     recursive : `bool`
         Recurse into directories?
@@ -489,7 +489,7 @@ def InstallLSST(self, prefix, dirs, ignoreRegex=None):
         Installation prefix.
     dirs : `list`
         Directories to install.
-    ignoreRegex : `str`
+    ignoreRegex : `str` or `re.Pattern`
         Regular expression for files and directories to ignore.
 
     Returns
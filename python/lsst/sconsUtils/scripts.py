@@ -2,23 +2,179 @@
 files.
 """
 
+import functools
 import os.path
 import re
-import shlex
 import shutil
+import sys
 import warnings
 from stat import ST_MODE
 
-from SCons.Script import BUILD_TARGETS, Dir, File, GetOption, Glob, SConscript
+from SCons.Script import BUILD_TARGETS, Dir, File, GetOption, Glob, SConscript, SetOption
 
 from . import dependencies, state, tests, utils
 
 DEFAULT_TARGETS = ("lib", "python", "shebang", "tests", "examples", "doc")
 
+# Check if Python is called on the first line with this expression.
+# This comes from distutils copy_scripts.
+_FIRST_LINE_RE = re.compile(r"^#!.*python[0-9.]*([ \t].*)?$")
+
+# Top-level directories that hold build output or third-party files rather
+# than SConscript files but can be large; the SConscript search does not
+# descend into them.
+_SKIP_DIRS = frozenset({"build", "__pycache__", "node_modules"})
+
+# Files that BasicSConstruct.finish does not install by default.
+_DEFAULT_INSTALL_IGNORE = re.compile(r"(~$|\.pyc$|^\.svn$|\.o$|\.os$)", re.ASCII)
+
+# Files and directories that --clean removes by default.
+_DEFAULT_CLEAN_EXT = ("*~", "core", "core.[1-9]*", "*.so", "*.os", "*.o", "*.pyc", "*.pkgc")
+_DEFAULT_CLEAN_DIRS = ("__pycache__", ".pytest_cache", "*.dist-info")
+
+
+@functools.cache
+def _getPathBase(path):
+    # Equivalent to os.path.splitext(os.path.basename(path))[0]: a dot only
+    # starts an extension if something other than dots precedes it.
+    base = path.rpartition("/")[2]
+    name = base.rpartition(".")[0]
+    return name if name.strip(".") else base
+
+
+@functools.cache
+def _haveDoxygen():
+    return shutil.which("doxygen") is not None
+
 
 def _getFileBase(node):
-    name, ext = os.path.splitext(os.path.basename(str(node)))
-    return name
+    return _getPathBase(str(node))
+
+
+def _findSConscripts(root=".", skipDirs=_SKIP_DIRS, stopAtSConscript=False):
+    """Find all SConscript files below a directory.
+
+    Hidden directories are skipped, as are any subdirectories containing
+    their own ``SConstruct`` file and any that cannot be read.  Directories
+    named in ``skipDirs`` are only skipped directly below ``root``.
+    Directories are visited depth-first in sorted order so that builds are
+    deterministic.
+
+    Parameters
+    ----------
+    root : `str`, optional
+        Directory to start the search from.
+    skipDirs : `frozenset` of `str`, optional
+        Names of top-level directories that should not be searched.
+    stopAtSConscript : `bool`, optional
+        If `True`, do not search below a subdirectory once an SConscript
+        file has been found in it.
+
+    Returns
+    -------
+    scripts : `list` of `str`
+        Paths to the SConscript files found, relative to ``root``.
+    """
+    scripts = []
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        subdirs = []
+        names = set()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            # Skip directories that cannot be read, as os.walk does.
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and (path != root or entry.name not in skipDirs):
+                        subdirs.append(entry.path)
+                elif not entry.is_dir():
+                    names.add(entry.name)
+        if "SConstruct" in names and path != root:
+            continue
+        if "SConscript" in names:
+            scripts.append(os.path.join(path, "SConscript"))
+            if stopAtSConscript and path != root:
+                continue
+        # Push in reverse order so that subdirectories are popped (and so
+        # visited) in sorted order.
+        subdirs.sort(reverse=True)
+        stack.extend(subdirs)
+    return scripts
+
+
+def _toLF(line):
+    """Convert CRLF and CR line endings in ``line`` (`bytes`) to LF."""
+    return line.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+def _rewriteShebang(target, source, env):
+    """Copy source to target, rewriting the shebang."""
+    doRewrite = utils.needShebangRewrite()
+    # Currently just use this python
+    usepython = utils.whichPython()
+    for targ, src in zip(target, source):
+        with open(str(src), "rb") as srcfd:
+            # Only the first line can change; the rest of the file is copied
+            # line by line.  As with a text-mode copy, line endings are
+            # normalised to LF, so that a script saved with CRLF endings does
+            # not end up with "python\r" as its interpreter.
+            firstLine = _toLF(srcfd.readline())
+            content = firstLine.rstrip(b"\n")
+            # Always match the first line so we can warn people
+            # if an attempt is being made to rewrite a file that
+            # should not be rewritten.  Anything not starting with "#!" can
+            # not match, so only decode and run the regex when it does.
+            match = None
+            if content.startswith(b"#!"):
+                match = _FIRST_LINE_RE.match(content.decode(errors="replace"))
+            if match and doRewrite:
+                post_interp = match.group(1) or ""
+                # Paths can be long so ensure that flake8 won't
+                # complain
+                firstLine = f"#!{usepython}{post_interp}  # noqa\n".encode()
+            elif not match:
+                state.log.warn(
+                    f"Could not rewrite shebang of {src}. Please check file or move it to bin directory."
+                )
+            # Create the bin/ file executable so that the mode normally needs
+            # no further changes; fstat the open descriptor to catch a
+            # restrictive umask or a pre-existing file.
+            fd = os.open(str(targ), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            with os.fdopen(fd, "wb") as outfd:
+                outfd.write(firstLine)
+                outfd.writelines(_toLF(line) for line in srcfd)
+                oldmode = os.fstat(fd)[ST_MODE] & 0o7777
+                newmode = (oldmode | 0o555) & 0o7777
+                if newmode != oldmode:
+                    state.log.info(f"changing mode of {str(targ)} from {oldmode} to {newmode}")
+                    os.fchmod(fd, newmode)
+
+
+def _checkTestStatus(target, source, env):
+    """Report the output of any failed tests and fail if there were any."""
+    testsDir = Dir("#tests/.tests").abspath
+    failed = []
+    for root, dirs, files in os.walk(testsDir):
+        dirs.sort()
+        failed.extend(os.path.join(root, name) for name in sorted(files) if name.endswith(".failed"))
+    if not failed:
+        return 0
+    print("Failed test output:", file=sys.stderr)
+    for path in failed:
+        if path.endswith(".xml.failed"):
+            print(f"Global pytest output is in {path}", file=sys.stderr)
+        else:
+            with open(path, errors="replace") as fd:
+                sys.stderr.write(fd.read())
+    print("The following tests failed:", file=sys.stderr)
+    for path in failed:
+        print(path, file=sys.stderr)
+    print(f"{len(failed)} tests failed", file=sys.stderr)
+    return 1
 
 
 class BasicSConstruct:
@@ -39,7 +195,17 @@ class BasicSConstruct:
     (which would be useless).
     """
 
+    __slots__ = ()
+
     _initializing = False
+    skipDirs = _SKIP_DIRS
+    """Names of top-level directories that are not searched for SConscript
+    files (`frozenset` of `str`).  Directories with these names further down
+    the tree are still searched.
+
+    Packages that keep SConscript files in one of these directories can
+    override this before calling `initialize`.
+    """
 
     def __new__(
         cls,
@@ -55,6 +221,10 @@ class BasicSConstruct:
         noCfgFile=False,
         sconscriptOrder=None,
         disableCc=False,
+        decider="MD5-timestamp",
+        implicitCache=False,
+        cacheDir=None,
+        stopAtSConscript=False,
     ):
         cls.initialize(
             packageName,
@@ -66,8 +236,10 @@ class BasicSConstruct:
             noCfgFile=noCfgFile,
             sconscriptOrder=sconscriptOrder,
             disableCc=disableCc,
+            cacheDir=cacheDir,
+            stopAtSConscript=stopAtSConscript,
         )
-        cls.finish(defaultTargets, subDirList, ignoreRegex)
+        cls.finish(defaultTargets, subDirList, ignoreRegex, decider=decider, implicitCache=implicitCache)
         return state.env
 
     @classmethod
@@ -82,13 +254,17 @@ class BasicSConstruct:
         noCfgFile=False,
         sconscriptOrder=None,
         disableCc=False,
+        cacheDir=None,
+        stopAtSConscript=False,
     ):
         """Convenience function to replace standard SConstruct boilerplate
         (step 1).
 
         This function:
 
-        - Calls all SConscript files found in subdirectories.
+        - Calls all SConscript files found in subdirectories, except below
+          the top-level directories listed in ``skipDirs`` (by default
+          ``build``, ``__pycache__`` and ``node_modules``).
         - Configures dependencies.
         - Sets how the ``--clean`` option works.
 
@@ -105,9 +281,9 @@ class BasicSConstruct:
             always the name of the package.
         eupsProductPath : `str`, optional
             An alternate directory where the package should be installed.
-        cleanExt : `list`, optional
-            Whitespace delimited sequence of globs for files to remove with
-            ``--clean``.
+        cleanExt : `str` or `list` [`str`], optional
+            Globs for files to remove with ``--clean``, as a list or a
+            whitespace delimited string.
         versionModuleName : `str`, optional
             If non-None, builds a ``version.py`` module as this file; ``'%s'``
             is replaced with the name of the package.
@@ -129,6 +305,17 @@ class BasicSConstruct:
             allows a faster startup and permits building on systems that don't
             meet the requirements for the C++ compiler (e.g., for
             pure-python packages).
+        cacheDir : `str`, optional
+            Directory to use as a shared SCons derived-file cache (see
+            ``CacheDir()``), so that object files can be reused between
+            builds and clones.  Only intermediate files are cached; the
+            targets in `lsst.sconsUtils.state.targets` and installed files
+            are always built locally.  Defaults to the ``SCONS_CACHE_DIR``
+            environment variable; no cache is used if neither is set.
+        stopAtSConscript : `bool`, optional
+            If `True`, do not look for further SConscript files below a
+            directory that has one, e.g. because that SConscript handles its
+            whole subtree itself.  By default the entire tree is searched.
 
         Returns
         -------
@@ -142,11 +329,20 @@ class BasicSConstruct:
             state.log.fail("Recursion detected; an SConscript file should not call BasicSConstruct.")
         cls._initializing = True
         dependencies.configure(packageName, versionString, eupsProduct, eupsProductPath, noCfgFile)
+        if cacheDir is None:
+            cacheDir = os.environ.get("SCONS_CACHE_DIR")
+        if cacheDir:
+            state.env.CacheDir(cacheDir)
         state.env.BuildETags()
         if cleanExt is None:
-            cleanExt = r"*~ core core.[1-9]* *.so *.os *.o *.pyc *.pkgc"
-        state.env.CleanTree(cleanExt, "__pycache__ .pytest_cache *.dist-info")
-        if versionModuleName is not None:
+            cleanExt = list(_DEFAULT_CLEAN_EXT)
+        # CleanTree splits its arguments with env.Split, which passes lists
+        # through but not tuples.
+        state.env.CleanTree(cleanExt, list(_DEFAULT_CLEAN_DIRS))
+        # The version module only needs to be declared once; a repeated
+        # initialize() reuses the existing target.  Nothing is built for
+        # --help, so do not declare it at all then.
+        if versionModuleName is not None and not state.targets["version"] and not GetOption("help"):
             try:
                 versionModuleName = versionModuleName % "/".join(packageName.split("_"))
             except TypeError:
@@ -159,15 +355,7 @@ class BasicSConstruct:
         # Python script generation does no harm since it will only do anything
         # if there is a scripts entry in pyproject.toml.
         state.targets["scripts"] = state.env.PythonScripts()
-        scripts = []
-        for root, dirs, files in os.walk("."):
-            if "SConstruct" in files and root != ".":
-                dirs[:] = []
-                continue
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
-            dirs.sort()  # os.walk order is not specified, but we want builds to be deterministic
-            if "SConscript" in files:
-                scripts.append(os.path.join(root, "SConscript"))
+        scripts = _findSConscripts(".", cls.skipDirs, stopAtSConscript)
         if sconscriptOrder is None:
             sconscriptOrder = DEFAULT_TARGETS
 
@@ -175,8 +363,9 @@ class BasicSConstruct:
         sconscriptOrder = [t if t != "shebang" else "bin.src" for t in sconscriptOrder]
 
         def key(path):
+            path = path.lstrip("./")
             for i, item in enumerate(sconscriptOrder):
-                if path.lstrip("./").startswith(item):
+                if path.startswith(item):
                     return i
             return len(sconscriptOrder)
 
@@ -188,7 +377,13 @@ class BasicSConstruct:
         return state.env
 
     @staticmethod
-    def finish(defaultTargets=DEFAULT_TARGETS, subDirList=None, ignoreRegex=None):
+    def finish(
+        defaultTargets=DEFAULT_TARGETS,
+        subDirList=None,
+        ignoreRegex=None,
+        decider="MD5-timestamp",
+        implicitCache=False,
+    ):
         """Convenience function to replace standard SConstruct boilerplate
         (step 2).
 
@@ -207,27 +402,57 @@ class BasicSConstruct:
         defaultTargets : `list`
             A sequence of targets (see `lsst.sconsUtils.state.targets`)
             that should be built when scons is run with no arguments.
-        ignoreRegex : `str`
+        ignoreRegex : `str` or `re.Pattern`
             Regular expression that matches files that should not be installed.
+        decider : `str` or callable, optional
+            The SCons decider used to determine whether files have changed;
+            passed to ``Decider()``.  The default only performs MD5 checks
+            when timestamps have changed.
+        implicitCache : `bool`, optional
+            If `True`, cache the results of implicit dependency scans (e.g.
+            ``#include`` lines) between builds, and trust cached content
+            signatures of files that have not been modified in the last
+            minute.  This makes null rebuilds much faster, but the cached
+            dependencies are only rescanned when a source file changes, not
+            when the include search path does: the ``-I`` flags are not part
+            of the build signature, so after e.g. setting up a different
+            version of an upstream product, objects are not rebuilt against
+            its headers.  Run with ``--implicit-deps-changed`` after any such
+            change.  Values given on the command line take precedence.  Off
+            by default.
 
         Returns
         -------
         env : `lsst.sconsUtils.env`
             A SCons Environment.
         """
+        state.env.Decider(decider)
+        if implicitCache:
+            SetOption("implicit_cache", True)
+            SetOption("max_drift", 60)
         if ignoreRegex is None:
-            ignoreRegex = r"(~$|\.pyc$|^\.svn$|\.o|\.os$)"
+            ignoreRegex = _DEFAULT_INSTALL_IGNORE
+        # List the top level here rather than reusing the SConscript search,
+        # since SConscripts may have created new entries in between.  One
+        # listing serves both the install list and the default targets.
+        with os.scandir(".") as it:
+            topEntries = {entry.name: entry.is_dir() for entry in it}
         if subDirList is None:
-            subDirList = []
-            for path in os.listdir("."):
-                if os.path.isdir(path) and not path.startswith("."):
-                    subDirList.append(path)
+            subDirList = [name for name, isDir in topEntries.items() if isDir and not name.startswith(".")]
         if "bin.src" in subDirList and "shebang" in state.targets and state.targets["shebang"]:
             # shebang makes a directory that should be installed
             subDirList += ["bin"]
         install = state.env.InstallLSST(state.env["prefix"], list(subDirList), ignoreRegex=ignoreRegex)
+        # Register every target as a prerequisite of install in one call;
+        # Requires flattens the values, whether nodes, strings or lists.
+        state.env.Requires(install, list(state.targets.values()))
+        # Only intermediate build products (object files) go through the
+        # derived-file cache.  The version module, rewritten scripts, test
+        # results and installed files depend on things outside their build
+        # signature (git state, interpreter path, run environment), so a
+        # cached copy from another checkout could be wrong.
+        state.env.NoCache(install, list(state.targets.values()))
         for name, target in state.targets.items():
-            state.env.Requires(install, target)
             state.env.Alias(name, target)
         state.env.Requires(state.targets["python"], state.targets["version"])
         declarer = state.env.Declare()
@@ -236,7 +461,7 @@ class BasicSConstruct:
         # shebang should be in the list if bin.src exists but the location
         # matters so we can not append it afterwards.
         state.env.Default(
-            [t for t in defaultTargets if os.path.exists(t) or (t == "shebang" and os.path.exists("bin.src"))]
+            [t for t in defaultTargets if t in topEntries or (t == "shebang" and "bin.src" in topEntries)]
         )
         if "version" in state.targets:
             state.env.Default(state.targets["version"])
@@ -249,45 +474,21 @@ class BasicSConstruct:
             state.env.Default(state.targets["scripts"])
             state.env.Requires(state.targets["tests"], state.targets["scripts"])
 
-        state.env.Decider("MD5-timestamp")  # if timestamps haven't changed, don't do MD5 checks
         #
         # Check if any of the tests failed by looking for *.failed files.
         # Perform this test just before scons exits
         #
-        # N.b. the test is written in sh not python as then we can use @ to
-        # suppress output
-        #
-        if "tests" in [str(t) for t in BUILD_TARGETS]:
-            testsDir = shlex.quote(os.path.join(os.getcwd(), "tests", ".tests"))
+        if any(str(t) == "tests" for t in BUILD_TARGETS):
             checkTestStatus_command = state.env.Command(
                 "checkTestStatus",
                 [],
-                f"""
-                @ if [ -d {testsDir} ]; then \
-                      nfail=`find {testsDir} -name "*.failed" | wc -l | sed -e 's/ //g'`; \
-                      if [ $$nfail -gt 0 ]; then \
-                          echo "Failed test output:" >&2; \
-                          for f in `find {testsDir} -name "*.failed"`; do \
-                              case "$$f" in \
-                              *.xml.failed) \
-                                echo "Global pytest output is in $$f" >&2; \
-                                ;; \
-                              *.failed) \
-                                cat $$f >&2; \
-                                ;; \
-                              esac; \
-                          done; \
-                          echo "The following tests failed:" >&2;\
-                          find {testsDir} -name "*.failed" >&2; \
-                          echo "$$nfail tests failed" >&2; exit 1; \
-                      fi; \
-                  fi; \
-            """,
+                state.env.Action(_checkTestStatus, strfunction=lambda *args: None),
             )
 
             state.env.Depends(checkTestStatus_command, BUILD_TARGETS)  # this is why the check runs last
             BUILD_TARGETS.extend(checkTestStatus_command)
             state.env.AlwaysBuild(checkTestStatus_command)
+            state.env.NoCache(checkTestStatus_command)
 
 
 class BasicSConscript:
@@ -300,6 +501,8 @@ class BasicSConscript:
     add it to the `~lsst.sconsUtils.state.state.targets` `dict`.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def lib(libName=None, src=None, libs="self", noBuildList=None):
         """Convenience function to replace standard lib/SConscript boilerplate.
@@ -334,13 +537,17 @@ class BasicSConscript:
         if src is None:
             src = Glob("#src/*.cc") + Glob("#src/*/*.cc") + Glob("#src/*/*/*.cc") + Glob("#src/*/*/*/*.cc")
         if noBuildList is not None:
-            src = [node for node in src if os.path.basename(str(node)) not in noBuildList]
+            noBuildSet = frozenset(noBuildList)
+            src = [node for node in src if os.path.basename(str(node)) not in noBuildSet]
         src = state.env.SourcesForSharedLibrary(src)
         if isinstance(libs, str):
             libs = state.env.getLibs(libs)
         elif libs is None:
             libs = []
         result = state.env.SharedLibrary(libName, src, LIBS=libs)
+        # Only cache the object files; the library itself is large and
+        # changes whenever any of them do.
+        state.env.NoCache(result)
         state.targets["lib"].extend(result)
         return result
 
@@ -360,52 +567,15 @@ class BasicSConscript:
         src : `str` or `~SCons.Script.Glob`, optional
             Glob to use to search for files.
         """
-        # check if Python is called on the first line with this expression
-        # This comes from distutils copy_scripts
-        FIRST_LINE_RE = re.compile(r"^#!.*python[0-9.]*([ \t].*)?$")
-        doRewrite = utils.needShebangRewrite()
-
-        def rewrite_shebang(target, source, env):
-            """Copy source to target, rewriting the shebang"""
-            # Currently just use this python
-            usepython = utils.whichPython()
-            for targ, src in zip(target, source):
-                with open(str(src)) as srcfd:
-                    with open(str(targ), "w") as outfd:
-                        first_line = srcfd.readline()
-                        # Always match the first line so we can warn people
-                        # if an attempt is being made to rewrite a file that
-                        # should not be rewritten
-                        match = FIRST_LINE_RE.match(first_line)
-                        if match and doRewrite:
-                            post_interp = match.group(1) or ""
-                            # Paths can be long so ensure that flake8 won't
-                            # complain
-                            outfd.write(f"#!{usepython}{post_interp}  # noqa\n")
-                        else:
-                            if not match:
-                                state.log.warn(
-                                    f"Could not rewrite shebang of {src}. Please check"
-                                    " file or move it to bin directory."
-                                )
-                            outfd.write(first_line)
-                        for line in srcfd.readlines():
-                            outfd.write(line)
-                # Ensure the bin/ file is executable
-                oldmode = os.stat(str(targ))[ST_MODE] & 0o7777
-                newmode = (oldmode | 0o555) & 0o7777
-                if newmode != oldmode:
-                    state.log.info(f"changing mode of {str(targ)} from {oldmode} to {newmode}")
-                    os.chmod(str(targ), newmode)
-
         if src is None:
             src = Glob("#bin.src/*")
         for s in src:
             filename = str(s)
             # Do not try to rewrite files starting with non-letters
-            if filename != "SConscript" and re.match("[A-Za-z]", filename):
+            first = filename[:1]
+            if filename != "SConscript" and first.isascii() and first.isalpha():
                 result = state.env.Command(
-                    target=os.path.join(Dir("#bin").abspath, filename), source=s, action=rewrite_shebang
+                    target=os.path.join(Dir("#bin").abspath, filename), source=s, action=_rewriteShebang
                 )
                 state.targets["shebang"].extend(result)
 
@@ -547,7 +717,7 @@ class BasicSConscript:
         result : ???
             ???
         """
-        if not shutil.which("doxygen"):
+        if not _haveDoxygen():
             state.log.warn("doxygen executable not found; skipping documentation build.")
             return []
         if projectName is None:
@@ -632,6 +802,7 @@ class BasicSConscript:
             return []
         if noBuildList is None:
             noBuildList = []
+        noBuildSet = frozenset(noBuildList)
         if pySingles is None:
             pySingles = []
         if swigNameList is None:
@@ -641,29 +812,30 @@ class BasicSConscript:
             swigFileList = [File(name + ".i") for name in swigNameList]
         if swigSrc is None:
             swigSrc = {}
-        allSwigSrc = set()
+        allSwigSrc = frozenset(str(element) for name in swigNameList for element in swigSrc.get(name, ()))
         for name, node in zip(swigNameList, swigFileList):
-            src = swigSrc.setdefault(name, [])
-            allSwigSrc.update(str(element) for element in src)
-            src.append(node)
+            swigSrc.setdefault(name, []).append(node)
         if pyList is None:
-            pyList = [
-                node
-                for node in Glob("*.py")
-                if _getFileBase(node) not in swigNameList and os.path.basename(str(node)) not in noBuildList
-            ]
+            pyList = []
+            swigNameSet = frozenset(swigNameList)
+            for node in Glob("*.py"):
+                path = str(node)
+                if _getPathBase(path) not in swigNameSet and os.path.basename(path) not in noBuildSet:
+                    pyList.append(node)
             # if we got no matches, reset to None so we do not enabled
             # auto test detection in pytest
             if not pyList:
                 pyList = None
         if ccList is None:
-            ccList = [
-                node
-                for node in Glob("*.cc")
-                if (not str(node).endswith("_wrap.cc"))
-                and str(node) not in allSwigSrc
-                and os.path.basename(str(node)) not in noBuildList
-            ]
+            ccList = []
+            for node in Glob("*.cc"):
+                path = str(node)
+                if (
+                    not path.endswith("_wrap.cc")
+                    and path not in allSwigSrc
+                    and os.path.basename(path) not in noBuildSet
+                ):
+                    ccList.append(node)
         if ignoreList is None:
             ignoreList = []
 
@@ -672,19 +844,21 @@ class BasicSConscript:
                 return ["None"]
             return [str(i) for i in ll]
 
-        state.log.info(f"SWIG modules for tests: {s(swigFileList)}")
-        state.log.info(f"Python tests: {s(pyList)}")
-        state.log.info(f"C++ tests: {s(ccList)}")
-        state.log.info(f"Files that will not be built: {noBuildList}")
-        state.log.info(f"Ignored tests: {ignoreList}")
+        # Only format the node lists if they will actually be printed.
+        if state.log.verbose:
+            state.log.info(f"SWIG modules for tests: {s(swigFileList)}")
+            state.log.info(f"Python tests: {s(pyList)}")
+            state.log.info(f"C++ tests: {s(ccList)}")
+            state.log.info(f"Files that will not be built: {noBuildList}")
+            state.log.info(f"Ignored tests: {ignoreList}")
         control = tests.Control(state.env, ignoreList=ignoreList, args=args, verbose=True)
+        testLibs = state.env.getLibs("main test")
         for ccTest in ccList:
-            state.env.Program(ccTest, LIBS=state.env.getLibs("main test"))
+            state.env.Program(ccTest, LIBS=testLibs)
         swigMods = []
+        pythonLibs = state.env.getLibs("main python")
         for name, src in swigSrc.items():
-            swigMods.extend(
-                state.env.SwigLoadableModule("_" + name, src, LIBS=state.env.getLibs("main python"))
-            )
+            swigMods.extend(state.env.SwigLoadableModule("_" + name, src, LIBS=pythonLibs))
 
         # Warn about insisting that a test in pySingles starts with test_ and
         # therefore might be automatically discovered by pytest. These files
@@ -698,7 +872,7 @@ class BasicSConscript:
         # Ensure that python tests listed in pySingles are not included in
         # pyList.
         if pyList is not None:
-            pyList = [str(node) for node in pyList if str(node) not in pySingles]
+            pyList = [path for path in map(str, pyList) if path not in pySingles]
 
         ccList = [control.run(str(node)) for node in ccList]
         pySingles = [control.run(str(node)) for node in pySingles]
@@ -716,15 +890,10 @@ class BasicSConscript:
         if pySingles:
             for i in range(len(pySingles) - 1):
                 state.env.Depends(pySingles[i + 1], pySingles[i])
-            for pyTest in pyList:
-                state.env.Depends(pyTest, pySingles[-1])
+            state.env.Depends(pyList, pySingles[-1])
 
         pyList.extend(pySingles)
-        for pyTest in pyList:
-            state.env.Depends(pyTest, ccList)
-            state.env.Depends(pyTest, swigMods)
-            state.env.Depends(pyTest, state.targets["python"])
-            state.env.Depends(pyTest, state.targets["shebang"])
+        state.env.Depends(pyList, [ccList, swigMods, state.targets["python"], state.targets["shebang"]])
         result = ccList + pyList
         state.targets["tests"].extend(result)
         return result
@@ -759,27 +928,24 @@ class BasicSConscript:
             swigFileList = [File(name) for name in swigNameList]
         if swigSrc is None:
             swigSrc = {}
-        allSwigSrc = set()
+        allSwigSrc = frozenset(str(element) for name in swigNameList for element in swigSrc.get(name, ()))
         for name, node in zip(swigNameList, swigFileList):
-            src = swigSrc.setdefault(name, [])
-            allSwigSrc.update(str(element) for element in src)
-            src.append(node)
+            swigSrc.setdefault(name, []).append(node)
         if ccList is None:
-            ccList = [
-                node
-                for node in Glob("*.cc")
-                if (not str(node).endswith("_wrap.cc")) and str(node) not in allSwigSrc
-            ]
+            ccList = []
+            for node in Glob("*.cc"):
+                path = str(node)
+                if not path.endswith("_wrap.cc") and path not in allSwigSrc:
+                    ccList.append(node)
         state.log.info(f"SWIG modules for examples: {swigFileList}")
         state.log.info(f"C++ examples: {ccList}")
         results = []
+        mainLibs = state.env.getLibs("main")
         for src in ccList:
-            results.extend(state.env.Program(src, LIBS=state.env.getLibs("main")))
+            results.extend(state.env.Program(src, LIBS=mainLibs))
+        pythonLibs = state.env.getLibs("main python")
         for name, src in swigSrc.items():
-            results.extend(
-                state.env.SwigLoadableModule("_" + name, src, LIBS=state.env.getLibs("main python"))
-            )
-        for result in results:
-            state.env.Depends(result, state.targets["lib"])
+            results.extend(state.env.SwigLoadableModule("_" + name, src, LIBS=pythonLibs))
+        state.env.Depends(results, state.targets["lib"])
         state.targets["examples"].extend(results)
         return results
@@ -16,7 +16,7 @@ by other code (particularly `lsst.sconsUtils.dependencies.configure`).
 import os
 import re
 import shlex
-from configparser import ConfigParser
+import sys
 
 import SCons.Conftest
 import SCons.Script
@@ -26,6 +26,76 @@ from .utils import get_conda_prefix, use_conda_compilers
 
 SCons.Script.EnsureSConsVersion(2, 1, 0)
 
+# Location of the custom SCons tools shipped with sconsUtils.
+_TOOL_PATH = os.path.join(os.path.dirname(__file__), "tools")
+
+# Patterns used while setting up the environment; compiled once at import.
+_DIR_VAR_RE = re.compile(r"^(?P<name>\w+)_DIR(?P<extra>_EXTRA)?$")
+_OPT_FLAG_RE = re.compile(r"^-O(\d|s|g|fast)$")
+
+# Recognised compilers for the ``cc`` variable, mapped to their C++ driver.
+# gcc may also be given with a version suffix, e.g. ``gcc-12``.
+_CC_FAMILIES = {"gcc": "g++", "icc": "icpc", "clang": "clang++", "cc": "c++"}
+_GCC_VERSIONED_RE = re.compile(r"gcc-\d+(\.\d+)*")
+
+# Patterns identifying the compiler from the output of ``$CC --version``.
+_CC_VERSION_RES = (
+    (re.compile(r"gcc(?:\-.+)? +\(.+\) +([0-9.a-zA-Z]+)"), "gcc"),
+    (re.compile(r"gnu-cc(?:\-.+)? +\(.+\) +([0-9.a-zA-Z]+)"), "gcc"),  # conda-build compiler on linux
+    (re.compile(r"\(GCC\) +([0-9.a-zA-Z]+) "), "gcc"),
+    (re.compile(r"LLVM +version +([0-9.a-zA-Z]+) "), "clang"),  # clang on Mac
+    (re.compile(r"clang +version +([0-9.a-zA-Z]+) "), "clang"),  # clang on linux or clang w/ conda on Mac
+    (re.compile(r"\(ICC\) +([0-9.a-zA-Z]+) "), "icc"),
+    (re.compile(r"cc \(Ubuntu +([0-9\~\-.a-zA-Z]+)\)"), "gcc"),  # gcc on Ubuntu (not always caught above)
+)
+
+# Environment variables passed through to the build environment.
+_PRESERVE_VARS = (
+    "DYLD_LIBRARY_PATH",
+    "EUPS_DIR",
+    "EUPS_LOCK_PID",
+    "EUPS_PATH",
+    "EUPS_SHELL",
+    "EUPS_USERDATA",
+    "LD_LIBRARY_PATH",
+    "PATH",
+    "SHELL",
+    "TEMP",
+    "TERM",
+    "TMP",
+    "TMPDIR",
+    "XPA_PORT",
+    "CONDA_BUILD_SYSROOT",
+    "SDKROOT",
+    "GCC_COLORS",
+)
+
+# Extra variables passed through when running under CodeChecker.
+_CODE_CHECKER_VARS = (
+    "LD_PRELOAD",
+    "CC_LOGGER_FILE",
+    "CC_LOGGER_GCC_LIKE",
+    "CC_LIB_DIR",
+    "CC_DATA_FILES_DIR",
+    "CC_LOGGER_BIN",
+)
+
+# The list of implicit multithreading environment variables here
+# is taken from lsst.utils.disable_implicit_threading(), but
+# has to be put here for dependency ordering reasons, and
+# to ensure these are set prior to any instantiation of pytest
+# or any code that may implicitly spawn threads.
+_IMPLICIT_MULTITHREADING_VARS = (
+    "OPENBLAS_NUM_THREADS",
+    "GOTO_NUM_THREADS",
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "MKL_DOMAIN_NUM_THREADS",
+    "MPI_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "NUMEXPR_MAX_THREADS",
+)
+
 """A dictionary of SCons aliases and targets.
 
 These are used to setup aliases, default targets, and dependencies by
@@ -198,83 +268,35 @@ def _initVariables():
 def _initEnvironment():
     """Construction and basic setup of the state.env variable."""
 
-    ourEnv = {}
-    preserveVars = [
-        "DYLD_LIBRARY_PATH",
-        "EUPS_DIR",
-        "EUPS_LOCK_PID",
-        "EUPS_PATH",
-        "EUPS_SHELL",
-        "EUPS_USERDATA",
-        "LD_LIBRARY_PATH",
-        "PATH",
-        "SHELL",
-        "TEMP",
-        "TERM",
-        "TMP",
-        "TMPDIR",
-        "XPA_PORT",
-        "CONDA_BUILD_SYSROOT",
-        "SDKROOT",
-        "GCC_COLORS",
-    ]
-
-    codeCheckerVars = [
-        "LD_PRELOAD",
-        "CC_LOGGER_FILE",
-        "CC_LOGGER_GCC_LIKE",
-        "CC_LIB_DIR",
-        "CC_DATA_FILES_DIR",
-        "CC_LOGGER_BIN",
-    ]
-
-    # The list of implicit multithreading environment variables here
-    # is taken from lsst.utils.disable_implicit_threading(), but
-    # has to be put here for dependency ordering reasons, and
-    # to ensure these are set prior to any instantiation of pytest
-    # or any code that may implicitly spawn threads.
-    implicitMultithreadingVars = [
-        "OPENBLAS_NUM_THREADS",
-        "GOTO_NUM_THREADS",
-        "OMP_NUM_THREADS",
-        "MKL_NUM_THREADS",
-        "MKL_DOMAIN_NUM_THREADS",
-        "MPI_NUM_THREADS",
-        "NUMEXPR_NUM_THREADS",
-        "NUMEXPR_MAX_THREADS",
-    ]
-
-    for key in preserveVars:
-        if key in os.environ:
-            ourEnv[key] = os.environ[key]
+    ourEnv = {key: os.environ[key] for key in _PRESERVE_VARS if key in os.environ}
 
     # check if running in CodeChecker environment
     if "CC_LOGGER_BIN" in os.environ:
-        for key in codeCheckerVars:
-            if key in os.environ:
-                ourEnv[key] = os.environ[key]
+        ourEnv.update({key: os.environ[key] for key in _CODE_CHECKER_VARS if key in os.environ})
 
     # Turn off implicit multithreading.
-    for key in implicitMultithreadingVars:
+    for key in _IMPLICIT_MULTITHREADING_VARS:
         ourEnv[key] = "1"
 
     # Find and propagate EUPS environment variables.
     cfgPath = []
-    for k in os.environ:
-        m = re.search(r"^(?P<name>\w+)_DIR(?P<extra>_EXTRA)?$", k)
+    for k, v in os.environ.items():
+        # Cheap suffix test first; most variables are not *_DIR.
+        if not k.endswith(("_DIR", "_DIR_EXTRA")):
+            continue
+        m = _DIR_VAR_RE.search(k)
         if not m:
             continue
-        cfgPath.append(os.path.join(os.environ[k], "ups"))
-        cfgPath.append(os.path.join(os.environ[k], "configs"))
+        cfgPath.append(os.path.join(v, "ups"))
+        cfgPath.append(os.path.join(v, "configs"))
         if m.group("extra"):
-            cfgPath.append(os.environ[k])
+            cfgPath.append(v)
         else:
-            cfgPath.append(os.path.join(os.environ[k], "ups"))
-            p = m.group("name")
-            varname = eupsForScons.utils.setupEnvNameFor(p)
-            if varname in os.environ:
-                ourEnv[varname] = os.environ[varname]
-                ourEnv[k] = os.environ[k]
+            varname = eupsForScons.utils.setupEnvNameFor(m.group("name"))
+            setupVal = os.environ.get(varname)
+            if setupVal is not None:
+                ourEnv[varname] = setupVal
+                ourEnv[k] = v
 
     # add <build root>/ups directory to the configuration search path
     # this allows the .cfg file for the package being built to be found without
@@ -290,9 +312,9 @@ def _initEnvironment():
             k, v = kv.split("=")
             ourEnv[k] = v
     global env
-    sconsUtilsPath, thisFile = os.path.split(__file__)
-    toolPath = os.path.join(sconsUtilsPath, "tools")
-    env = SCons.Script.Environment(ENV=ourEnv, variables=opts, toolpath=[toolPath], tools=["default", "cuda"])
+    env = SCons.Script.Environment(
+        ENV=ourEnv, variables=opts, toolpath=[_TOOL_PATH], tools=["default", "cuda"]
+    )
     env.cfgPath = cfgPath
     #
     # We don't want "lib" inserted at the beginning of loadable module names;
@@ -301,9 +323,10 @@ def _initEnvironment():
     env["LDMODULEPREFIX"] = ""
     if env["PLATFORM"] == "darwin":
         env["LDMODULESUFFIX"] = ".so"
-        if not re.search(r"-install_name", str(env["SHLINKFLAGS"])):
+        shLinkFlags = str(env["SHLINKFLAGS"])
+        if "-install_name" not in shLinkFlags:
             env.Append(SHLINKFLAGS=["-install_name", "${TARGET.file}"])
-        if not re.search(r"-headerpad_max_install_names", str(env["SHLINKFLAGS"])):
+        if "-headerpad_max_install_names" not in shLinkFlags:
             env.Append(SHLINKFLAGS=["-Wl,-headerpad_max_install_names"])
         #
         # We want to be explicit about the OS X version we're targeting
@@ -350,10 +373,7 @@ def _initEnvironment():
     #
     # SCons Variables do not behave like dicts
     for opt in opts.keys():
-        try:
-            del SCons.Script.ARGUMENTS[opt]
-        except KeyError:
-            pass
+        SCons.Script.ARGUMENTS.pop(opt, None)
     #
     # Process those arguments
     #
@@ -385,20 +405,24 @@ def _initEnvironment():
     # Find the eups path, replace 'flavor' in favor of 'PLATFORM' if needed.
     #
     eupsPath = None
+    eupsPathVar = os.environ.get("EUPS_PATH")
     try:
         db = env["eupsdb"]
-        if "EUPS_PATH" not in os.environ:
+        if eupsPathVar is None:
             raise RuntimeError("You can't use eupsdb=XXX without an EUPS_PATH set")
-        eupsPath = None
-        for d in os.environ["EUPS_PATH"].split(":"):
-            if re.search(rf"/{db}$|^{db}/|/{db}/", d):
+        # db is a literal path fragment; escape it so that it only matches
+        # whole components at the start, middle or end of an entry.
+        dbRe = re.escape(db)
+        dbPattern = re.compile(rf"/{dbRe}$|^{dbRe}/|/{dbRe}/")
+        for d in eupsPathVar.split(":"):
+            if dbPattern.search(d):
                 eupsPath = d
                 break
         if not eupsPath:
             raise RuntimeError(f'I cannot find DB "{db}" in $EUPS_PATH')
     except KeyError:
-        if "EUPS_PATH" in os.environ:
-            eupsPath = os.environ["EUPS_PATH"].split(":")[0]
+        if eupsPathVar is not None:
+            eupsPath = eupsPathVar.split(":")[0]
     env["eupsPath"] = eupsPath
     try:
         env["PLATFORM"] = env["flavor"]
@@ -430,8 +454,9 @@ def _initEnvironment():
     # our code to run even outside of tests. Executables would normally
     # pick up the linker environment variables via libraryLoaderEnvironment().
     for envvar in ["PYTHONPATH", "HTTP_PROXY", "HTTPS_PROXY"]:
-        if envvar in os.environ:
-            env.AppendENVPath(envvar, os.environ[envvar])
+        value = os.environ.get(envvar)
+        if value is not None:
+            env.AppendENVPath(envvar, value)
 
 
 _configured = False
@@ -460,22 +485,12 @@ def _configureCommon():
         version : `str`
             Compiler version or "unknown".
         """
-        versionNameList = (
-            (r"gcc(?:\-.+)? +\(.+\) +([0-9.a-zA-Z]+)", "gcc"),
-            (r"gnu-cc(?:\-.+)? +\(.+\) +([0-9.a-zA-Z]+)", "gcc"),  # catch the conda-build compiler on linux
-            (r"\(GCC\) +([0-9.a-zA-Z]+) ", "gcc"),
-            (r"LLVM +version +([0-9.a-zA-Z]+) ", "clang"),  # clang on Mac
-            (r"clang +version +([0-9.a-zA-Z]+) ", "clang"),  # clang on linux or clang w/ conda on Mac
-            (r"\(ICC\) +([0-9.a-zA-Z]+) ", "icc"),
-            (r"cc \(Ubuntu +([0-9\~\-.a-zA-Z]+)\)", "gcc"),  # gcc on Ubuntu (not always caught by #3 above)
-        )
-
         context.Message("Checking who built the CC compiler...")
         result = context.TryAction(SCons.Script.Action(r"$CC --version > $TARGET"))
         ccVersDumpOK, ccVersDump = result[0:2]
         if ccVersDumpOK:
-            for reStr, compilerName in versionNameList:
-                match = re.search(reStr, ccVersDump)
+            for versionRe, compilerName in _CC_VERSION_RES:
+                match = versionRe.search(ccVersDump)
                 if match:
                     compilerVersion = match.groups()[0]
                     context.Result(f"{compilerName}={compilerVersion}")
@@ -499,18 +514,12 @@ def _configureCommon():
         else:
             if env["cc"] != "":
                 CC = CXX = None
-                if re.search(r"^gcc(-\d+(\.\d+)*)?( |$)", env["cc"]):
-                    CC = env["cc"]
-                    CXX = re.sub(r"^gcc", "g++", CC)
-                elif re.search(r"^icc( |$)", env["cc"]):
-                    CC = env["cc"]
-                    CXX = re.sub(r"^icc", "icpc", CC)
-                elif re.search(r"^clang( |$)", env["cc"]):
+                ccName = env["cc"].split(" ", 1)[0]
+                if _GCC_VERSIONED_RE.fullmatch(ccName):
+                    ccName = "gcc"
+                if ccName in _CC_FAMILIES:
                     CC = env["cc"]
-                    CXX = re.sub(r"^clang", "clang++", CC)
-                elif re.search(r"^cc( |$)", env["cc"]):
-                    CC = env["cc"]
-                    CXX = re.sub(r"^cc", "c++", CC)
+                    CXX = _CC_FAMILIES[ccName] + CC[len(ccName) :]
                 else:
                     log.fail(f"Unrecognised compiler: {env['cc']}")
                 env0 = SCons.Script.Environment()
@@ -537,15 +546,12 @@ def _configureCommon():
     #
     ARCHFLAGS = os.environ.get("ARCHFLAGS", env.get("archflags"))
     if ARCHFLAGS:
-        env.Append(CCFLAGS=ARCHFLAGS.split())
-        env.Append(LINKFLAGS=ARCHFLAGS.split())
+        env.Append(CCFLAGS=ARCHFLAGS.split(), LINKFLAGS=ARCHFLAGS.split())
     # We'll add warning and optimisation options last
     if env["profile"] == "1" or env["profile"] == "pg":
-        env.Append(CCFLAGS=["-pg"])
-        env.Append(LINKFLAGS=["-pg"])
+        env.Append(CCFLAGS=["-pg"], LINKFLAGS=["-pg"])
     elif env["profile"] == "gcov":
-        env.Append(CCFLAGS="--coverage")
-        env.Append(LINKFLAGS="--coverage")
+        env.Append(CCFLAGS="--coverage", LINKFLAGS="--coverage")
 
     #
     # Enable C++17 support
@@ -569,29 +575,26 @@ def _configureCommon():
     #
     # Byte order
     #
-    import socket
-
-    if socket.htons(1) != 1:
+    if sys.byteorder == "little":
         env.Append(CCFLAGS=["-DLSST_LITTLE_ENDIAN=1"])
     #
     # If we're linking to libraries that themselves linked to
     # shareable libraries we need to do something special.
     #
-    if re.search(r"^(Linux|Linux64)$", env["eupsFlavor"]) and "LD_LIBRARY_PATH" in os.environ:
-        env.Append(LINKFLAGS=["-Wl,-rpath-link"])
-        env.Append(LINKFLAGS=[f'-Wl,{os.environ["LD_LIBRARY_PATH"]}'])
+    ldLibraryPath = os.environ.get("LD_LIBRARY_PATH")
+    if env["eupsFlavor"] in ("Linux", "Linux64") and ldLibraryPath is not None:
+        env.Append(LINKFLAGS=["-Wl,-rpath-link", f"-Wl,{ldLibraryPath}"])
     #
     # Set the optimization level.
     #
     if env["opt"]:
-        env["CCFLAGS"] = [o for o in env["CCFLAGS"] if not re.search(r"^-O(\d|s|g|fast)$", o)]
+        env["CCFLAGS"] = [o for o in env["CCFLAGS"] if not _OPT_FLAG_RE.search(o)]
         env.MergeFlags(f'-O{env["opt"]}')
     #
     # Set compiler-specific warning flags.
     #
     if env.whichCc == "clang":
-        env.Append(CCFLAGS=["-Wall"])
-        env["CCFLAGS"] = [o for o in env["CCFLAGS"] if not re.search(r"^-mno-fused-madd$", o)]
+        env["CCFLAGS"] = [o for o in env["CCFLAGS"] if o != "-mno-fused-madd"]
 
         ignoreWarnings = {
             "unused-function": "boost::regex has functions in anon namespaces in headers",
@@ -609,15 +612,19 @@ def _configureCommon():
             "unknown-pragmas": "unknown pragma ignored",
             "deprecated-register": "register is deprecated",
         }
-        for k in ignoreWarnings:
-            env.Append(CCFLAGS=[f"-Wno-{k}"])
+        warnFlags = ["-Wall"]
+        warnFlags.extend(f"-Wno-{k}" for k in ignoreWarnings)
         if env.GetOption("filterWarn"):
-            for k in filterWarnings:
-                env.Append(CCFLAGS=[f"-Wno-{k}"])
+            warnFlags.extend(f"-Wno-{k}" for k in filterWarnings)
+        env.Append(CCFLAGS=warnFlags)
     elif env.whichCc == "gcc":
-        env.Append(CCFLAGS=["-Wall"])
-        env.Append(CCFLAGS=["-Wno-unknown-pragmas"])  # we don't want complaints about icc/clang pragmas
-        env.Append(CCFLAGS=["-Wno-unused-local-typedefs"])  # boost generates a lot of these
+        env.Append(
+            CCFLAGS=[
+                "-Wall",
+                "-Wno-unknown-pragmas",  # we don't want complaints about icc/clang pragmas
+                "-Wno-unused-local-typedefs",  # boost generates a lot of these
+            ]
+        )
     elif env.whichCc == "icc":
         env.Append(CCFLAGS=["-Wall"])
         filterWarnings = {
@@ -648,8 +655,7 @@ def _configureCommon():
     # binaries
     #
     if env.whichCc == "gcc":
-        env.Append(CCFLAGS=["-fno-lto"])
-        env.Append(LINKFLAGS=["-fno-lto"])
+        env.Append(CCFLAGS=["-fno-lto"], LINKFLAGS=["-fno-lto"])
 
 
 def _saveState():
@@ -664,6 +670,8 @@ def _saveState():
     if env.GetOption("clean"):
         return
 
+    from configparser import ConfigParser
+
     config = ConfigParser()
     config.add_section("Build")
     config.set("Build", "cc", env.whichCc)
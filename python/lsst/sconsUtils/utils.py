@@ -14,6 +14,7 @@ __all__ = (
     "get_conda_prefix",
 )
 
+import functools
 import os
 import platform
 import subprocess
@@ -116,6 +117,7 @@ def whichPython():
     return _pythonPath
 
 
+@functools.cache
 def needShebangRewrite():
     """Is shebang rewriting required?
 
@@ -123,6 +125,8 @@ def needShebangRewrite():
     -------
     rewrite : `bool`
         Returns True if the shebang lines of executables should be rewritten.
+        The result is cached since the platform does not change between
+        calls.
     """
     return _has_OSX_SIP()
 
@@ -0,0 +1,11 @@
+# -------- This file is automatically generated by LSST's sconsUtils -------- #
+__version__: str = "34dd521"
+__repo_version__: str = "34dd521"
+__fingerprint__: str = "34dd5214fbcef4c8773234021d53154e041fa1d1"
+__dependency_versions__: dict[str, str | None] = {}
+__all__ = (
+    "__version__",
+    "__repo_version__",
+    "__fingerprint__",
+    "__dependency_versions__",
+)
@@ -0,0 +1,26 @@
+tests/testSingle.py
+
+============================= test session starts ==============================
+platform linux -- Python 3.11.7, pytest-9.1.1, pluggy-1.6.0
+rootdir: /root/package
+configfile: pyproject.toml
+plugins: xdist-3.8.0, platformdirs-4.13.0, cov-7.1.0, session2file-0.1.11
+collected 1 item
+
+tests/testSingle.py .                                                    [100%]
+
+------- generated xml file: /root/package/tests/.tests/testSingle.py.xml -------
+================================ tests coverage ================================
+_______________ coverage: platform linux, python 3.11.7-final-0 ________________
+
+Name                  Stmts   Miss Branch BrPart  Cover
+-------------------------------------------------------
+tests/testSingle.py       6      1      2      1    75%
+-------------------------------------------------------
+TOTAL                     6      1      2      1    75%
+Coverage HTML written to dir tests/.tests/testSingle.py-htmlcov
+Coverage XML written to file tests/.tests/testSingle.py-cov-sconsUtils.xml
+============================= slowest 5 durations ==============================
+
+(3 durations < 0.005s hidden.  Use -vv to show these durations.)
+============================== 1 passed in 0.07s ===============================
@@ -0,0 +1,11 @@
+# -------- This file is automatically generated by LSST's sconsUtils -------- #
+__version__: str = "unknown"
+__repo_version__: str = "unknown"
+__fingerprint__: str = "0x0"
+__dependency_versions__: dict[str, str | None] = {}
+__all__ = (
+    "__version__",
+    "__repo_version__",
+    "__fingerprint__",
+    "__dependency_versions__",
+)
@@ -31,6 +31,7 @@ or by typing
 
 import os
 import subprocess
+import tempfile
 import unittest
 
 
@@ -55,6 +56,48 @@ class SconsUtilsTestCase(unittest.TestCase):
             "Failed to detect failed tests",
         )
 
+    def _makeGitPackage(self, path, tag):
+        """Create a minimal package as a git repository tagged ``tag``."""
+        os.makedirs(os.path.join(path, "ups"))
+        os.makedirs(os.path.join(path, "python", "lsst", "cachetest"))
+        with open(os.path.join(path, "SConstruct"), "w") as fd:
+            fd.write(
+                "from lsst.sconsUtils import scripts\n\n"
+                'scripts.BasicSConstruct("cachetest", disableCc=True)\n'
+            )
+        with open(os.path.join(path, "ups", "cachetest.cfg"), "w") as fd:
+            fd.write(
+                "from lsst.sconsUtils import Configuration\n\n"
+                "dependencies = {}\n\n"
+                "config = Configuration(__file__, libs=[], hasSwigFiles=False)\n"
+            )
+        open(os.path.join(path, "python", "lsst", "cachetest", "__init__.py"), "w").close()
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        for args in (["init", "-q"], ["add", "-A"], ["commit", "-q", "-m", "Initial"], ["tag", tag]):
+            subprocess.check_call(git + args, cwd=path)
+
+    def testSharedCacheVersion(self):
+        """Check that version.py is not taken from a shared CacheDir."""
+        with tempfile.TemporaryDirectory() as tmpDir:
+            pythonPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "python")
+            env = dict(
+                os.environ,
+                PYTHONPATH=os.pathsep.join(filter(None, [pythonPath, os.environ.get("PYTHONPATH")])),
+                SCONS_CACHE_DIR=os.path.join(tmpDir, "cache"),
+            )
+            for tag in ("1.0.0", "2.0.0"):
+                pkgDir = os.path.join(tmpDir, tag)
+                self._makeGitPackage(pkgDir, tag)
+                subprocess.check_call(
+                    ["scons", "-Q", "version"],
+                    cwd=pkgDir,
+                    env=env,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                with open(os.path.join(pkgDir, "python", "lsst", "cachetest", "version.py")) as fd:
+                    self.assertIn(f'__version__: str = "{tag}"', fd.read())
+
 
 if __name__ == "__main__":
     unittest.main()
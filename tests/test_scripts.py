@@ -0,0 +1,137 @@
+"""Tests for the helper functions in lsst.sconsUtils.scripts."""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Make sure that we test our copy of sconsUtils.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "python"))
+
+from lsst.sconsUtils import scripts
+
+
+class FindSConscriptsTestCase(unittest.TestCase):
+    """Tests for scripts._findSConscripts."""
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.root = self.tmpDir.name
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+    def makeFiles(self, *paths):
+        for path in paths:
+            path = os.path.join(self.root, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+
+    def find(self, **kwargs):
+        return [os.path.relpath(path, self.root) for path in scripts._findSConscripts(self.root, **kwargs)]
+
+    def testSortedOrder(self):
+        self.makeFiles(
+            "SConscript",
+            "tests/SConscript",
+            "python/lsst/pkg/sub/SConscript",
+            "python/lsst/pkg/SConscript",
+            "lib/SConscript",
+            "python/a/SConscript",
+        )
+        self.assertEqual(
+            self.find(),
+            [
+                "SConscript",
+                "lib/SConscript",
+                "python/a/SConscript",
+                "python/lsst/pkg/SConscript",
+                "python/lsst/pkg/sub/SConscript",
+                "tests/SConscript",
+            ],
+        )
+
+    def testNestedSConstruct(self):
+        self.makeFiles(
+            "lib/SConscript",
+            "tests/other/SConstruct",
+            "tests/other/SConscript",
+            "tests/other/sub/SConscript",
+        )
+        self.assertEqual(self.find(), ["lib/SConscript"])
+
+    def testHiddenAndSkipped(self):
+        self.makeFiles(
+            ".hidden/SConscript",
+            "lib/.hidden/SConscript",
+            "build/SConscript",
+            "lib/SConscript",
+            "tests/build/SConscript",
+        )
+        # skipDirs only applies directly below the root.
+        self.assertEqual(
+            self.find(skipDirs=frozenset({"build"})),
+            ["lib/SConscript", "tests/build/SConscript"],
+        )
+
+    def testStopAtSConscript(self):
+        self.makeFiles("lib/SConscript", "lib/sub/SConscript", "tests/sub/SConscript")
+        self.assertEqual(self.find(stopAtSConscript=True), ["lib/SConscript", "tests/sub/SConscript"])
+
+    def testUnreadableDirectory(self):
+        self.makeFiles("lib/SConscript", "locked/SConscript", "ok/SConscript")
+        locked = os.path.join(self.root, "locked")
+        scandir = os.scandir
+
+        def fakeScandir(path):
+            if path == locked:
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        with mock.patch.object(scripts.os, "scandir", fakeScandir):
+            found = self.find()
+        self.assertEqual(found, ["lib/SConscript", "ok/SConscript"])
+
+
+class RewriteShebangTestCase(unittest.TestCase):
+    """Tests for scripts._rewriteShebang."""
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+    def rewrite(self, content, doRewrite=True):
+        src = os.path.join(self.tmpDir.name, "src")
+        targ = os.path.join(self.tmpDir.name, "targ")
+        with open(src, "wb") as fd:
+            fd.write(content)
+        with (
+            mock.patch.object(scripts.utils, "needShebangRewrite", return_value=doRewrite),
+            mock.patch.object(scripts.utils, "whichPython", return_value="/opt/bin/python"),
+        ):
+            scripts._rewriteShebang([targ], [src], None)
+        self.assertTrue(os.access(targ, os.X_OK))
+        with open(targ, "rb") as fd:
+            return fd.read()
+
+    def testRewrite(self):
+        self.assertEqual(
+            self.rewrite(b"#!/usr/bin/env python -u\nprint(1)\n"),
+            b"#!/opt/bin/python -u  # noqa\nprint(1)\n",
+        )
+
+    def testNoRewrite(self):
+        content = b"#!/usr/bin/env python\nprint(1)\n"
+        self.assertEqual(self.rewrite(content, doRewrite=False), content)
+
+    def testCrlf(self):
+        content = b"#!/usr/bin/env python\r\nprint(1)\r\n"
+        self.assertEqual(self.rewrite(content), b"#!/opt/bin/python  # noqa\nprint(1)\n")
+        self.assertEqual(self.rewrite(content, doRewrite=False), b"#!/usr/bin/env python\nprint(1)\n")
+
+
+if __name__ == "__main__":
+    unittest.main()